@@ -18,6 +18,7 @@ class BotConfig:
 
     token: str
     log_level: str = "INFO"
+    log_diagnose: bool = True
 
     # Localization settings
     fallback_language: str = "ru"
@@ -37,6 +38,8 @@ class BotConfig:
         return cls(
             token=token,
             log_level=os.getenv("LOG_LEVEL", "INFO"),
+            log_diagnose=os.getenv("LOG_DIAGNOSE", "true").strip().lower()
+            in ("1", "true", "yes", "on"),
             fallback_language=os.getenv("FALLBACK_LANGUAGE", "ru"),
             locales_dir=os.getenv("LOCALES_DIR", "locales"),
             api_base_url=os.getenv("API_BASE_URL", "https://api.example.com"),
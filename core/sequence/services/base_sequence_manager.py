@@ -100,8 +100,10 @@ class BaseSequenceManager(SequenceManagerProtocol, ABC):
             # Call hook for custom logic
             self._on_answer_added(session, answer)
 
-            logger.debug(
-                f"Added answer for {answer.question_key} to session {session.session_id}"
+            logger.debug(  # noqa: PLE1205
+                "Added answer for {} to session {}",
+                answer.question_key,
+                session.session_id,
             )
             return True
 
@@ -132,8 +134,10 @@ class BaseSequenceManager(SequenceManagerProtocol, ABC):
             # Call hook for custom logic
             self._on_step_advanced(session)
 
-            logger.debug(
-                f"Advanced to step {session.current_step} in session {session.session_id}"
+            logger.debug(  # noqa: PLE1205
+                "Advanced to step {} in session {}",
+                session.current_step,
+                session.session_id,
             )
             return True
 
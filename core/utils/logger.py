@@ -19,7 +19,12 @@ def setup_logger() -> None:
     - Proper log levels
     - Exception tracing
     - Structured format
+
+    Safe to call repeatedly; only the first call configures sinks.
     """
+    if getattr(setup_logger, "_done", False):
+        return
+
     # Remove default logger
     logger.remove()
 
@@ -33,10 +38,11 @@ def setup_logger() -> None:
         level=config.log_level,
         colorize=True,
         backtrace=True,
-        diagnose=True,
+        diagnose=config.log_diagnose,
     )
 
-    # Add file logger for errors
+    # Add file logger for errors; the file and logs/ directory are only
+    # created once the first error is emitted
     logger.add(
         "logs/bot_errors.log",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
@@ -44,10 +50,12 @@ def setup_logger() -> None:
         rotation="10 MB",
         retention="1 month",
         compression="zip",
+        delay=True,
         backtrace=True,
-        diagnose=True,
+        diagnose=config.log_diagnose,
     )
 
+    setup_logger._done = True
     logger.info("Logger configured successfully")
 
 
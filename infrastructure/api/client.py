@@ -49,6 +49,15 @@ class HttpClient:
         if self._session and not self._session.closed:
             await self._session.close()
 
+    async def __aenter__(self) -> "HttpClient":
+        """Open the underlying session so requests reuse one connector."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the underlying session on exit."""
+        await self.close()
+
     async def request(self, method: str, endpoint: str, **kwargs) -> ApiResponse:
         """
         Make HTTP request with error handling.
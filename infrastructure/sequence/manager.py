@@ -40,8 +40,10 @@ class InMemorySequenceManager(BaseSequenceManager):
         Args:
             session: Accessed session
         """
-        logger.debug(
-            f"Accessed sequence session {session.session_id} for user {session.user_id}"
+        logger.debug(  # noqa: PLE1205
+            "Accessed sequence session {} for user {}",
+            session.session_id,
+            session.user_id,
         )
 
     def _on_answer_added(
@@ -66,8 +68,10 @@ class InMemorySequenceManager(BaseSequenceManager):
         Args:
             session: Session that advanced
         """
-        logger.debug(
-            f"Advanced to step {session.current_step} in session {session.session_id}"
+        logger.debug(  # noqa: PLE1205
+            "Advanced to step {} in session {}",
+            session.current_step,
+            session.session_id,
         )
 
     def _on_session_completed(self, session: SequenceSession) -> None: